@@ -1,7 +1,16 @@
 import logging
 import threading
-from collections import defaultdict
-from typing import Dict, List, Optional
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+try:
+    # Cython-level lock with much cheaper uncontended acquire/release than
+    # threading.Lock; the shard critical sections are three integer adds, so
+    # acquire overhead dominates the work done under the lock.
+    from fastrlock.rlock import FastRLock as _FastLock
+except ImportError:  # pragma: no cover - wheel not available on all platforms
+    _FastLock = threading.Lock
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +22,58 @@ _CRITICAL_THRESHOLD = 25
 _BRUTE_FORCE_TYPES = {"SSH_BRUTE_FORCE", "FTP_BRUTE_FORCE"}
 _RECON_TYPES = {"HTTP_PROBE"}
 
+_THREAT_LEVELS = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+_ATTACK_PATTERNS = ("BRUTE_FORCE", "RECONNAISSANCE", "EXPLOIT_ATTEMPT")
+
+
+def _make_recommendation_templates(threat_level: str, attack_pattern: str) -> Tuple[Tuple[bool, str], ...]:
+    """Build the (needs_ip, template) pairs for one threat/pattern combo."""
+    recs: List[Tuple[bool, str]] = []
+    if threat_level in ("HIGH", "CRITICAL"):
+        recs.append((True, "Block IP {ip} immediately at the firewall level."))
+    if attack_pattern == "BRUTE_FORCE":
+        recs.append((False, "Enable account lockout policies and consider fail2ban."))
+        recs.append((False, "Disable password authentication and enforce SSH key-based login."))
+    elif attack_pattern == "RECONNAISSANCE":
+        recs.append((False, "Review exposed HTTP endpoints and remove unnecessary server banners."))
+        recs.append((False, "Enable a Web Application Firewall (WAF)."))
+    else:
+        recs.append((False, "Investigate the source IP and review related logs."))
+    if threat_level == "CRITICAL":
+        recs.append((False, "Escalate to the incident response team."))
+    return tuple(recs)
+
+
+# All 12 threat/pattern combinations, frozen at import time so the per-event
+# path is a single dict lookup plus one format call for the IP-bearing line.
+_REC_TEMPLATES: Dict[Tuple[str, str], Tuple[Tuple[bool, str], ...]] = {
+    (threat, pattern): _make_recommendation_templates(threat, pattern)
+    for threat in _THREAT_LEVELS
+    for pattern in _ATTACK_PATTERNS
+}
+
+# Number of counter shards; must be a power of two so the shard can be
+# selected with a cheap bitmask on the IP hash.
+_NUM_SHARDS = 32
+
+
+class _CounterShard:
+    """One independent slice of the analyzer's counters with its own lock.
+
+    Events are routed to a shard by attacker IP, so concurrent honeypot
+    handlers processing different attackers never contend on the same lock,
+    while all events for a given IP still land on one shard and keep the
+    per-IP history consistent.
+    """
+
+    __slots__ = ("lock", "by_ip", "by_type", "by_threat")
+
+    def __init__(self):
+        self.lock = _FastLock()
+        self.by_ip: Counter = Counter()
+        self.by_type: Counter = Counter()
+        self.by_threat: Counter = Counter()
+
 
 class AttackAnalyzer:
     """Singleton real-time attack analyzer and behavior tracker."""
@@ -25,10 +86,7 @@ class AttackAnalyzer:
     # ------------------------------------------------------------------
 
     def __init__(self):
-        self._attack_counts: Dict[str, int] = defaultdict(int)  # keyed by IP
-        self._type_counts: Dict[str, int] = defaultdict(int)
-        self._threat_counts: Dict[str, int] = defaultdict(int)
-        self._data_lock = threading.Lock()
+        self._shards = [_CounterShard() for _ in range(_NUM_SHARDS)]
 
     @classmethod
     def get_instance(cls) -> "AttackAnalyzer":
@@ -53,18 +111,17 @@ class AttackAnalyzer:
         attacker_ip = event_dict.get("attacker_ip", "unknown")
         attack_type = event_dict.get("attack_type", "UNKNOWN")
 
-        with self._data_lock:
-            self._attack_counts[attacker_ip] += 1
-            self._type_counts[attack_type] += 1
-            history = self._attack_counts[attacker_ip]
+        shard = self._shards[hash(attacker_ip) & (_NUM_SHARDS - 1)]
+        with shard.lock:
+            shard.by_ip[attacker_ip] += 1
+            shard.by_type[attack_type] += 1
+            history = shard.by_ip[attacker_ip]
+            threat_level = self._compute_threat_level(history, attack_type)
+            shard.by_threat[threat_level] += 1
 
-        threat_level = self._compute_threat_level(history, attack_type)
         attack_pattern = self._detect_pattern(attack_type)
         recommendations = self._build_recommendations(threat_level, attack_pattern, attacker_ip)
 
-        with self._data_lock:
-            self._threat_counts[threat_level] += 1
-
         return {
             "threat_level": threat_level,
             "attack_pattern": attack_pattern,
@@ -73,11 +130,24 @@ class AttackAnalyzer:
 
     def get_statistics(self) -> dict:
         """Return aggregated statistics about observed attacks."""
-        with self._data_lock:
-            type_counts = dict(self._type_counts)
-            threat_counts = dict(self._threat_counts)
-            # Top 10 attacking IPs by count
-            top_ips = sorted(self._attack_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        attack_counts: Counter = Counter()
+        type_counts: Counter = Counter()
+        threat_counts: Counter = Counter()
+        for shard in self._shards:
+            # Copy each shard under its own lock, then merge outside it so a
+            # slow aggregation never blocks the increment path.
+            with shard.lock:
+                ip_snap = dict(shard.by_ip)
+                type_snap = dict(shard.by_type)
+                threat_snap = dict(shard.by_threat)
+            attack_counts.update(ip_snap)
+            type_counts.update(type_snap)
+            threat_counts.update(threat_snap)
+
+        type_counts = dict(type_counts)
+        threat_counts = dict(threat_counts)
+        # Top 10 attacking IPs by count; most_common selects via C-level heapq
+        top_ips = attack_counts.most_common(10)
 
         return {
             "attack_counts_by_type": type_counts,
@@ -91,16 +161,35 @@ class AttackAnalyzer:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _compute_threat_level(history: int, attack_type: str) -> str:
+    def _history_bucket(history: int) -> int:
+        """Collapse the raw per-IP count into one of four threshold bands."""
         if history >= _CRITICAL_THRESHOLD:
-            return "CRITICAL"
+            return 3
         if history >= _HIGH_THRESHOLD:
+            return 2
+        if history >= _MEDIUM_THRESHOLD:
+            return 1
+        return 0
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _threat_for_bucket(bucket: int, attack_type: str) -> str:
+        if bucket == 3:
+            return "CRITICAL"
+        if bucket == 2:
             return "HIGH"
-        if history >= _MEDIUM_THRESHOLD or attack_type in _BRUTE_FORCE_TYPES:
+        if bucket == 1 or attack_type in _BRUTE_FORCE_TYPES:
             return "MEDIUM"
         return "LOW"
 
     @staticmethod
+    def _compute_threat_level(history: int, attack_type: str) -> str:
+        return AttackAnalyzer._threat_for_bucket(
+            AttackAnalyzer._history_bucket(history), attack_type
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=64)
     def _detect_pattern(attack_type: str) -> str:
         if attack_type in _BRUTE_FORCE_TYPES:
             return "BRUTE_FORCE"
@@ -110,17 +199,7 @@ class AttackAnalyzer:
 
     @staticmethod
     def _build_recommendations(threat_level: str, attack_pattern: str, ip: str) -> List[str]:
-        recs: List[str] = []
-        if threat_level in ("HIGH", "CRITICAL"):
-            recs.append(f"Block IP {ip} immediately at the firewall level.")
-        if attack_pattern == "BRUTE_FORCE":
-            recs.append("Enable account lockout policies and consider fail2ban.")
-            recs.append("Disable password authentication and enforce SSH key-based login.")
-        elif attack_pattern == "RECONNAISSANCE":
-            recs.append("Review exposed HTTP endpoints and remove unnecessary server banners.")
-            recs.append("Enable a Web Application Firewall (WAF).")
-        else:
-            recs.append("Investigate the source IP and review related logs.")
-        if threat_level == "CRITICAL":
-            recs.append("Escalate to the incident response team.")
-        return recs
+        return [
+            template.format(ip=ip) if needs_ip else template
+            for needs_ip, template in _REC_TEMPLATES[(threat_level, attack_pattern)]
+        ]
@@ -1,15 +1,19 @@
 import csv
+import hmac
 import io
-import json
 import logging
 import os
 import signal
 import sys
+import threading
 from datetime import datetime, timezone
 from functools import wraps
 from typing import Dict
 
+import orjson
+from cachetools import TTLCache
 from flask import Flask, Response, jsonify, request, send_from_directory
+from flask.json.provider import JSONProvider
 
 # Allow running as `python -m api.app` from the repo root
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -21,17 +25,29 @@ from honeypot.http_honeypot import HTTPHoneypot
 from honeypot.ftp_honeypot import FTPHoneypot
 
 
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for faster (de)serialization."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 class JsonFormatter(logging.Formatter):
     def format(self, record):
         log_data = {
-            "timestamp": self.formatTime(record),
+            # orjson serializes the datetime natively; OPT_UTC_Z renders it
+            # as ISO-8601 with a Z suffix without going through formatTime.
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc),
             "level": record.levelname,
             "service": record.name,
             "message": record.getMessage(),
         }
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
-        return json.dumps(log_data)
+        return orjson.dumps(log_data, option=orjson.OPT_UTC_Z).decode()
 
 
 logging.basicConfig(level=logging.INFO)
@@ -44,9 +60,48 @@ logger = logging.getLogger(__name__)
 _DASHBOARD_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dashboard")
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+class HoneypotRegistry:
+    """Thread-safe registry of running honeypot instances keyed by type string.
+
+    Flask worker threads read the registry while control-plane requests
+    mutate it; all access goes through an RLock and readers get snapshots,
+    so iteration never races a concurrent start/stop.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._instances: Dict[str, object] = {}
+
+    def get(self, hp_type: str):
+        with self._lock:
+            return self._instances.get(hp_type)
+
+    def add(self, hp_type: str, hp) -> None:
+        with self._lock:
+            self._instances[hp_type] = hp
+
+    def pop(self, hp_type: str):
+        with self._lock:
+            return self._instances.pop(hp_type, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._instances.clear()
+
+    def snapshot(self):
+        """Return a consistent list of (type, instance) pairs."""
+        with self._lock:
+            return list(self._instances.items())
+
+    def values(self):
+        with self._lock:
+            return list(self._instances.values())
+
 
 # Global registry of running honeypot instances keyed by type string
-honeypot_registry: Dict[str, object] = {}
+honeypot_registry = HoneypotRegistry()
 
 _HONEYPOT_CLASSES = {
     "ssh": SSHHoneypot,
@@ -59,14 +114,20 @@ _HONEYPOT_CLASSES = {
 # ---------------------------------------------------------------------------
 
 _API_KEY = os.environ.get("API_KEY") or None
+_API_KEY_BYTES = _API_KEY.encode() if _API_KEY else None
+_BEARER_PREFIX = b"Bearer "
 
 
 def require_api_key(f):
     @wraps(f)
     def decorated(*args, **kwargs):
-        if _API_KEY:
-            auth = request.headers.get("Authorization", "")
-            if not auth.startswith("Bearer ") or auth[len("Bearer "):] != _API_KEY:
+        if _API_KEY_BYTES:
+            auth = request.headers.get("Authorization", "").encode()
+            # compare_digest keeps the comparison constant-time so the key
+            # cannot be recovered byte-by-byte from response latency.
+            if not auth.startswith(_BEARER_PREFIX) or not hmac.compare_digest(
+                auth[len(_BEARER_PREFIX):], _API_KEY_BYTES
+            ):
                 return _err("Unauthorized", 401)
         return f(*args, **kwargs)
     return decorated
@@ -110,8 +171,10 @@ def list_attacks():
     try:
         limit = int(request.args.get("limit", 100))
         offset = int(request.args.get("offset", 0))
+        raw_before = request.args.get("before_id")
+        before_id = int(raw_before) if raw_before is not None else None
     except ValueError:
-        return _err("limit and offset must be integers")
+        return _err("limit, offset and before_id must be integers")
 
     if limit <= 0 or offset < 0:
         return _err("limit must be > 0 and offset must be >= 0")
@@ -124,10 +187,17 @@ def list_attacks():
 
     db = AttackDatabase.get_instance()
     try:
-        attacks = db.get_attacks(limit=limit, offset=offset, filters=filters or None)
+        attacks = db.get_attacks(
+            limit=limit, offset=offset, filters=filters or None, before_id=before_id
+        )
     except ValueError as exc:
         return _err(str(exc))
-    return _ok({"attacks": attacks, "count": len(attacks)})
+    payload = {"attacks": attacks, "count": len(attacks)}
+    if attacks:
+        # Pass this back as ?before_id= to fetch the next (older) page with
+        # an index seek instead of an O(offset) scan.
+        payload["next_before_id"] = attacks[-1]["id"]
+    return _ok(payload)
 
 
 @app.route("/api/attacks/<int:attack_id>", methods=["GET"])
@@ -144,31 +214,45 @@ def get_attack(attack_id: int):
 # ---------------------------------------------------------------------------
 
 
+# Statistics change slowly relative to dashboard polling (several clients
+# refreshing every second), so serve the aggregations from a short TTL
+# cache instead of re-running them per request.
+_stats_cache: TTLCache = TTLCache(maxsize=4, ttl=2.0)
+_stats_cache_lock = threading.Lock()
+
+
+def _cached_stats(key: str, producer):
+    with _stats_cache_lock:
+        cached = _stats_cache.get(key)
+    if cached is not None:
+        return cached
+    value = producer()
+    with _stats_cache_lock:
+        _stats_cache[key] = value
+    return value
+
+
 @app.route("/api/statistics", methods=["GET"])
 def get_statistics():
-    db_stats = AttackDatabase.get_instance().get_attack_statistics()
-    analyzer_stats = AttackAnalyzer.get_instance().get_statistics()
+    db_stats = _cached_stats(
+        "database", AttackDatabase.get_instance().get_attack_statistics
+    )
+    analyzer_stats = _cached_stats(
+        "analyzer", AttackAnalyzer.get_instance().get_statistics
+    )
     return _ok({"database": db_stats, "analyzer": analyzer_stats})
 
 
 @app.route("/api/stats/summary", methods=["GET"])
 def stats_summary():
     db = AttackDatabase.get_instance()
-    stats = db.get_attack_statistics()
+    stats = _cached_stats("database", db.get_attack_statistics)
 
     # Most targeted service
     by_type = stats.get("attacks_by_type", {})
     most_targeted = max(by_type, key=by_type.get) if by_type else None
 
-    # Busiest hour in last 24h
-    with db._lock:
-        rows = db._conn.execute(
-            "SELECT strftime('%H', timestamp) as hr, COUNT(*) as cnt "
-            "FROM attack_events "
-            "WHERE timestamp >= datetime('now', '-24 hours') "
-            "GROUP BY hr ORDER BY cnt DESC LIMIT 1"
-        ).fetchall()
-    busiest_hour = rows[0][0] if rows else None
+    busiest_hour = db.get_busiest_hour()
 
     return _ok({
         "total_attacks": stats["total_attacks"],
@@ -201,33 +285,72 @@ def list_alerts():
 # ---------------------------------------------------------------------------
 
 
-@app.route("/api/export/csv", methods=["GET"])
-def export_csv():
-    db = AttackDatabase.get_instance()
-    attacks = db.get_attacks(limit=100000)
+# Cached serialized exports keyed by format. attack_events is append-only,
+# so (max id, row count) uniquely identifies the table contents and doubles
+# as the ETag value.
+_export_cache: Dict[str, tuple] = {}
+_export_cache_lock = threading.Lock()
+
+
+def _export_etag(db) -> str:
+    max_id, count = db.get_export_state()
+    return f'"{max_id}-{count}"'
+
+
+def _export_response(fmt: str, etag: str, payload: str | bytes, mimetype: str) -> Response:
+    return Response(
+        payload,
+        mimetype=mimetype,
+        headers={
+            "Content-Disposition": f"attachment; filename=attacks.{fmt}",
+            "ETag": etag,
+        },
+    )
+
+
+def _serialize_csv(attacks) -> str:
     output = io.StringIO()
     if attacks:
         writer = csv.DictWriter(output, fieldnames=list(attacks[0].keys()))
         writer.writeheader()
         writer.writerows(attacks)
+    return output.getvalue()
+
+
+@app.route("/api/export/csv", methods=["GET"])
+def export_csv():
+    db = AttackDatabase.get_instance()
+    etag = _export_etag(db)
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status=304, headers={"ETag": etag})
+
+    with _export_cache_lock:
+        cached = _export_cache.get("csv")
+    if cached is None or cached[0] != etag:
+        payload = _serialize_csv(db.get_attacks(limit=100000))
+        with _export_cache_lock:
+            _export_cache["csv"] = (etag, payload)
     else:
-        output.write("")
-    return Response(
-        output.getvalue(),
-        mimetype="text/csv",
-        headers={"Content-Disposition": "attachment; filename=attacks.csv"},
-    )
+        payload = cached[1]
+    return _export_response("csv", etag, payload, "text/csv")
 
 
 @app.route("/api/export/json", methods=["GET"])
 def export_json():
     db = AttackDatabase.get_instance()
-    attacks = db.get_attacks(limit=100000)
-    return Response(
-        json.dumps({"attacks": attacks}),
-        mimetype="application/json",
-        headers={"Content-Disposition": "attachment; filename=attacks.json"},
-    )
+    etag = _export_etag(db)
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status=304, headers={"ETag": etag})
+
+    with _export_cache_lock:
+        cached = _export_cache.get("json")
+    if cached is None or cached[0] != etag:
+        payload = orjson.dumps({"attacks": db.get_attacks(limit=100000)})
+        with _export_cache_lock:
+            _export_cache["json"] = (etag, payload)
+    else:
+        payload = cached[1]
+    return _export_response("json", etag, payload, "application/json")
 
 
 # ---------------------------------------------------------------------------
@@ -238,7 +361,9 @@ def export_json():
 @app.route("/api/honeypots", methods=["GET"])
 def list_honeypots():
     result = []
-    for hp_type, hp in honeypot_registry.items():
+    # Build the JSON from a snapshot so a concurrent start/stop can't
+    # mutate the registry mid-iteration.
+    for hp_type, hp in honeypot_registry.snapshot():
         result.append(
             {
                 "type": hp_type,
@@ -260,7 +385,8 @@ def start_honeypot():
     if hp_type not in _HONEYPOT_CLASSES:
         return _err(f"Unknown honeypot type '{hp_type}'. Valid types: {list(_HONEYPOT_CLASSES)}")
 
-    if hp_type in honeypot_registry and honeypot_registry[hp_type].is_running:
+    existing = honeypot_registry.get(hp_type)
+    if existing is not None and existing.is_running:
         return _err(f"Honeypot '{hp_type}' is already running", 409)
 
     cls = _HONEYPOT_CLASSES[hp_type]
@@ -270,7 +396,7 @@ def start_honeypot():
     try:
         hp = cls(host=host, port=port)
         hp.start()
-        honeypot_registry[hp_type] = hp
+        honeypot_registry.add(hp_type, hp)
     except Exception as exc:
         logger.exception("Failed to start %s honeypot", hp_type)
         return _err(str(exc), 500)
@@ -295,7 +421,7 @@ def stop_honeypot():
         return _err(f"Honeypot '{hp_type}' is not running", 404)
 
     hp.stop()
-    honeypot_registry.pop(hp_type, None)
+    honeypot_registry.pop(hp_type)
     return _ok({"message": f"{hp_type.upper()} honeypot stopped"})
 
 
@@ -318,10 +444,16 @@ if __name__ == "__main__":
             except Exception:
                 pass
         honeypot_registry.clear()
+        try:
+            AttackDatabase.get_instance().flush()
+        except Exception:
+            pass
         logger.info("Clean shutdown complete")
         sys.exit(0)
 
     signal.signal(signal.SIGTERM, _shutdown)
     signal.signal(signal.SIGINT, _shutdown)
 
-    app.run(host="0.0.0.0", port=5000, debug=False)
+    # threaded=True so one slow handler (e.g. a large export) never blocks
+    # concurrent dashboard polling and control-plane requests.
+    app.run(host="0.0.0.0", port=5000, debug=False, threaded=True)
@@ -1,6 +1,23 @@
-from .base import BaseHoneypot
-from .ssh_honeypot import SSHHoneypot
-from .http_honeypot import HTTPHoneypot
-from .ftp_honeypot import FTPHoneypot
+import importlib
+
+# Lazy re-exports (PEP 562): importing the package no longer pulls in every
+# honeypot module, so a process that only needs e.g. FTPHoneypot skips the
+# import cost of the others.
+_SUBMODULES = {
+    "BaseHoneypot": ".base",
+    "SSHHoneypot": ".ssh_honeypot",
+    "HTTPHoneypot": ".http_honeypot",
+    "FTPHoneypot": ".ftp_honeypot",
+}
 
 __all__ = ["BaseHoneypot", "SSHHoneypot", "HTTPHoneypot", "FTPHoneypot"]
+
+
+def __getattr__(name):
+    try:
+        module = importlib.import_module(_SUBMODULES[name], __name__)
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    attr = getattr(module, name)
+    globals()[name] = attr  # cache so __getattr__ runs once per name
+    return attr
@@ -1,27 +1,139 @@
+import functools
 import logging
+import selectors
+import socket
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 
+import ahocorasick
+
 logger = logging.getLogger(__name__)
 
+# How long a reactor loop sleeps waiting for socket events; bounds the
+# shutdown latency of stop().
+_SELECT_TIMEOUT = 0.5
+
+# Seconds a connection may live before the reactor drops it. Real probes
+# finish their exchange within one round trip; anything older is a stalled
+# scanner (Slowloris pattern) pinning a file descriptor.
+_SESSION_TIMEOUT = 10.0
+
+# Kernel receive buffer for accepted sockets: probe payloads are tiny, so
+# the default (often 128 KiB+) would just waste kernel memory per stalled
+# connection.
+_SO_RCVBUF_SIZE = 8192
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS.") cache for _utc_timestamp. Events
+# arrive in bursts, so the datetime construction and strftime for the
+# second-granularity prefix are paid once per second, not once per event.
+# The benign race on this tuple is harmless: a stale read just re-derives
+# the same prefix.
+_ts_cache = (0, "")
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as ``%Y-%m-%dT%H:%M:%S.%f+00:00``.
+
+    Microseconds are always present (unlike ``datetime.isoformat()``,
+    which drops them when zero), so timestamps are fixed-width while
+    staying ISO-8601 parseable. The date/time prefix is only formatted
+    when the wall-clock second changes; within a second just the
+    microsecond suffix is rendered.
+    """
+    global _ts_cache
+    now = time.time()
+    sec = int(now)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = datetime.fromtimestamp(sec, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.")
+        _ts_cache = (sec, prefix)
+    return f"{prefix}{int((now - sec) * 1_000_000):06d}+00:00"
+
 _DANGEROUS_KEYWORDS = frozenset({
     "wget", "curl", "chmod", "rm -rf", "bash", "nc ", "python", "perl",
 })
 
 
+def _build_keyword_automaton() -> "ahocorasick.Automaton":
+    """Compile the dangerous keywords into an Aho-Corasick automaton.
+
+    Matching all keywords then takes a single pass over the payload instead
+    of one substring scan per keyword.
+    """
+    automaton = ahocorasick.Automaton()
+    for keyword in _DANGEROUS_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+# Single-pass escape table: one C-level translate call instead of five
+# chained .replace() passes, each of which copies the whole payload.
+_XSS_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+
 def _sanitize(text: str) -> str:
     """Replace HTML special characters with entities to prevent XSS."""
-    return (
-        text.replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;")
-            .replace("'", "&#x27;")
-    )
+    return text.translate(_XSS_TABLE)
+
+
+# Process-lifetime caches for the storage/analyzer singletons. log_attack
+# runs once per attack event, so resolving the singletons through the
+# classmethod + lock dance every time is avoidable overhead; after the first
+# call these are a plain function-call + cached return. The imports stay
+# inside the helpers to avoid circular imports at module load time.
+
+
+@functools.cache
+def _database():
+    from storage.database import AttackDatabase
+
+    return AttackDatabase.get_instance()
+
+
+@functools.cache
+def _analyzer():
+    from analyzer.analyzer import AttackAnalyzer
+
+    return AttackAnalyzer.get_instance()
+
+
+class ReactorSession:
+    """Per-connection state tracked by a honeypot's selector loop.
+
+    Subclasses extend ``__slots__`` with their protocol-specific fields.
+    """
+
+    __slots__ = ("addr", "out_buf", "done", "deadline")
+
+    def __init__(self, addr: tuple, out_buf: bytes = b""):
+        self.addr = addr
+        self.out_buf = out_buf
+        self.done = False
+        self.deadline = time.monotonic() + _SESSION_TIMEOUT
 
 
 class BaseHoneypot(ABC):
-    """Abstract base class for all honeypot types."""
+    """Abstract base class for all honeypot types.
+
+    Provides a shared selector-based reactor (:meth:`_event_loop`): one
+    thread multiplexes every connection on non-blocking sockets, which is
+    all these one-shot, I/O-bound protocols need. Subclasses plug in via
+    :meth:`_create_session`, :meth:`_on_data` and :meth:`_on_session_end`.
+    """
+
+    # Bytes read per recv(); subclasses override to fit their protocol.
+    _recv_size = 1024
 
     def __init__(self, host: str, port: int, honeypot_type: str):
         self._host = host
@@ -62,18 +174,154 @@ class BaseHoneypot(ABC):
         self._is_running = False
         logger.info("Honeypot %s stopped on %s:%d", self._honeypot_type, self._host, self._port)
 
+    # ------------------------------------------------------------------
+    # Selector reactor
+    # ------------------------------------------------------------------
+
+    def _create_session(self, addr: tuple) -> ReactorSession:
+        """Build the per-connection session for a newly accepted socket."""
+        raise NotImplementedError
+
+    def _on_data(self, session: ReactorSession, data: bytes) -> None:
+        """Handle a non-empty chunk received for ``session``."""
+        raise NotImplementedError
+
+    def _on_session_end(self, session: ReactorSession) -> None:
+        """Record the finished session (socket already closed)."""
+        raise NotImplementedError
+
+    def _event_loop(self, server_sock: socket.socket):
+        # Each loop owns its selector and the sessions accepted on its
+        # listener, so concurrent loops share no mutable state.
+        sel = selectors.DefaultSelector()
+        try:
+            sel.register(server_sock, selectors.EVENT_READ, data=None)
+        except (OSError, ValueError):
+            # stop() closed the listener before this thread got going.
+            sel.close()
+            return
+        next_sweep = time.monotonic() + _SELECT_TIMEOUT
+        while self._is_running:
+            try:
+                events = sel.select(timeout=_SELECT_TIMEOUT)
+            except OSError:
+                break
+            for key, mask in events:
+                if key.data is None:
+                    self._accept(sel, key.fileobj)
+                else:
+                    self._service(sel, key.fileobj, key.data, mask)
+            now = time.monotonic()
+            if now >= next_sweep:
+                next_sweep = now + _SELECT_TIMEOUT
+                self._sweep_stale(sel, now)
+        self._close_all(sel)
+
+    def _sweep_stale(self, sel: selectors.BaseSelector, now: float):
+        """Drop sessions that have outlived their deadline.
+
+        A connect-and-stall attacker otherwise holds its FD and session
+        forever, since a silent socket never becomes ready in select().
+        """
+        for key in list(sel.get_map().values()):
+            session = key.data
+            if session is not None and now >= session.deadline:
+                self._finish(sel, key.fileobj, session)
+
+    def _accept(self, sel: selectors.BaseSelector, server_sock: socket.socket):
+        try:
+            client_sock, addr = server_sock.accept()
+        except OSError:
+            return
+        client_sock.setblocking(False)
+        try:
+            # Send queued bytes the moment they are written instead of
+            # letting Nagle hold small packets back; the FD closes sooner.
+            client_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            client_sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SO_RCVBUF_SIZE)
+        except OSError:
+            pass
+        session = self._create_session(addr)
+        events = selectors.EVENT_READ
+        if session.out_buf:
+            events |= selectors.EVENT_WRITE
+        sel.register(client_sock, events, data=session)
+
+    def _service(
+        self,
+        sel: selectors.BaseSelector,
+        client_sock: socket.socket,
+        session: ReactorSession,
+        mask: int,
+    ):
+        try:
+            if mask & selectors.EVENT_WRITE and session.out_buf:
+                sent = client_sock.send(session.out_buf)
+                session.out_buf = session.out_buf[sent:]
+            if mask & selectors.EVENT_READ and not session.done:
+                data = client_sock.recv(self._recv_size)
+                if not data:
+                    session.done = True
+                else:
+                    self._on_data(session, data)
+        except OSError:
+            self._finish(sel, client_sock, session)
+            return
+
+        if session.done and not session.out_buf:
+            self._finish(sel, client_sock, session)
+        else:
+            self._update_interest(sel, client_sock, session)
+
+    @staticmethod
+    def _update_interest(
+        sel: selectors.BaseSelector, client_sock: socket.socket, session: ReactorSession
+    ):
+        events = 0
+        if not session.done:
+            events |= selectors.EVENT_READ
+        if session.out_buf:
+            events |= selectors.EVENT_WRITE
+        try:
+            sel.modify(client_sock, events, data=session)
+        except (KeyError, OSError):
+            pass
+
+    def _finish(
+        self, sel: selectors.BaseSelector, client_sock: socket.socket, session: ReactorSession
+    ):
+        try:
+            sel.unregister(client_sock)
+        except (KeyError, OSError):
+            pass
+        try:
+            client_sock.close()
+        except OSError:
+            pass
+        self._on_session_end(session)
+
+    @staticmethod
+    def _close_all(sel: selectors.BaseSelector):
+        """Close any sockets still registered when a loop exits."""
+        for key in list(sel.get_map().values()):
+            try:
+                sel.unregister(key.fileobj)
+            except (KeyError, OSError):
+                pass
+            try:
+                key.fileobj.close()
+            except OSError:
+                pass
+        sel.close()
+
     # ------------------------------------------------------------------
     # Attack logging
     # ------------------------------------------------------------------
 
     def log_attack(self, attacker_ip: str, attacker_port: int, data: str, attack_type: str) -> dict:
         """Record an attack event in the database and run the analyzer."""
-        # Import here to avoid circular imports at module load time
-        from storage.database import AttackDatabase
-        from analyzer.analyzer import AttackAnalyzer
-
         event = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _utc_timestamp(),
             "attacker_ip": attacker_ip,
             "attacker_port": attacker_port,
             "honeypot_type": self._honeypot_type,
@@ -82,7 +330,7 @@ class BaseHoneypot(ABC):
         }
 
         try:
-            analysis = AttackAnalyzer.get_instance().analyze_attack(event)
+            analysis = _analyzer().analyze_attack(event)
             event["threat_level"] = analysis.get("threat_level", "LOW")
             event["attack_pattern"] = analysis.get("attack_pattern", "UNKNOWN")
         except Exception:
@@ -90,30 +338,29 @@ class BaseHoneypot(ABC):
             event["threat_level"] = "LOW"
             event["attack_pattern"] = "UNKNOWN"
 
-        try:
-            inserted_id = AttackDatabase.get_instance().record_attack(event)
-            event["id"] = inserted_id
-        except Exception:
-            logger.exception("Database error for event %s", event)
-
         # Raise an alert for high-severity events or dangerous commands
-        data_lower = data.lower()
-        has_dangerous = any(kw in data_lower for kw in _DANGEROUS_KEYWORDS)
+        has_dangerous = next(_KEYWORD_AUTOMATON.iter(data.lower()), None) is not None
+        alert = None
         if event.get("threat_level") in ("HIGH", "CRITICAL") or has_dangerous:
             alert_type = "DANGEROUS_COMMAND" if has_dangerous else "HIGH_THREAT"
-            try:
-                AttackDatabase.get_instance().record_alert({
-                    "timestamp": event["timestamp"],
-                    "attacker_ip": attacker_ip,
-                    "alert_type": alert_type,
-                    "detail": (
-                        f"threat_level={event.get('threat_level')} "
-                        f"attack_type={attack_type} data={event.get('raw_data', '')[:200]}"
-                    ),
-                    "attack_id": event.get("id"),
-                })
-            except Exception:
-                logger.exception("Alert recording error for event %s", event)
+            alert = {
+                "timestamp": event["timestamp"],
+                "attacker_ip": attacker_ip,
+                "alert_type": alert_type,
+                "detail": (
+                    f"threat_level={event.get('threat_level')} "
+                    f"attack_type={attack_type} data={event.get('raw_data', '')[:200]}"
+                ),
+                "attack_id": None,  # linked to the attack row by the writer
+            }
+
+        try:
+            # Fire-and-forget: the storage layer's background writer batches
+            # queued events into shared transactions, so the handler never
+            # waits on a commit.
+            _database().enqueue_attack(event, alert)
+        except Exception:
+            logger.exception("Database error for event %s", event)
 
         logger.warning(
             "[%s] Attack from %s:%d | type=%s | threat=%s",
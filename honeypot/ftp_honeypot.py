@@ -1,8 +1,10 @@
 import logging
+import os
+import queue
 import socket
 import threading
 
-from .base import BaseHoneypot
+from .base import BaseHoneypot, ReactorSession
 
 logger = logging.getLogger(__name__)
 
@@ -13,87 +15,147 @@ _USER_OK = b"331 Password required\r\n"
 _PASS_FAIL = b"530 Login incorrect\r\n"
 _GENERIC_ERR = b"500 Command not understood\r\n"
 
+# Maximum commands accepted per connection before the session is dropped,
+# mirroring the previous USER/PASS exchange limit.
+_MAX_COMMANDS = 4
+
+# Sentinel telling the log worker thread to exit.
+_LOG_STOP = object()
+
+# Upper bound on parallel reactors when SO_REUSEPORT is available.
+_MAX_REACTORS = 4
+
+
+class _FTPSession(ReactorSession):
+    """Per-connection state tracked by the selector loop."""
+
+    __slots__ = ("username", "password", "commands")
+
+    def __init__(self, addr: tuple):
+        # The banner is queued up front, so the session starts out
+        # write-interested.
+        super().__init__(addr, out_buf=_BANNER)
+        self.username = ""
+        self.password = ""
+        self.commands = 0
+
 
 class FTPHoneypot(BaseHoneypot):
-    """TCP honeypot that mimics an FTP server to capture credential brute-force attempts."""
+    """TCP honeypot that mimics an FTP server to capture credential brute-force attempts.
+
+    Connections are multiplexed on the selector reactor shared with the
+    other honeypots. Where the platform supports SO_REUSEPORT, several
+    listener sockets are bound to the same port and served by independent
+    reactors, letting the kernel hash incoming connections across them with
+    no userspace coordination.
+    """
+
+    _recv_size = _RECV_SIZE
 
     def __init__(self, host: str = "0.0.0.0", port: int = _DEFAULT_PORT):
         super().__init__(host, port, "FTP")
-        self._server_socket: socket.socket | None = None
-        self._thread: threading.Thread | None = None
+        self._server_sockets: list = []
+        self._threads: list = []
+        self._log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._log_thread: threading.Thread | None = None
 
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
 
     def start(self):
-        self._server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self._server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self._server_socket.bind((self._host, self._port))
-        self._server_socket.listen(5)
-        self._is_running = True
+        # Drop any sockets/threads left from a previous run so a
+        # start() after stop() begins from a clean slate.
+        self._server_sockets = []
+        self._threads = []
+        reuse_port = hasattr(socket, "SO_REUSEPORT")
+        num_reactors = min(_MAX_REACTORS, os.cpu_count() or 1) if reuse_port else 1
 
-        self._thread = threading.Thread(target=self._accept_loop, daemon=True)
-        self._thread.start()
-        logger.info("FTPHoneypot listening on %s:%d", self._host, self._port)
+        for _ in range(num_reactors):
+            server_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if reuse_port:
+                server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            server_sock.bind((self._host, self._port))
+            server_sock.listen(128)
+            server_sock.setblocking(False)
+            self._server_sockets.append(server_sock)
+
+        self._is_running = True
+        self._log_thread = threading.Thread(target=self._log_worker, daemon=True)
+        self._log_thread.start()
+        for server_sock in self._server_sockets:
+            thread = threading.Thread(
+                target=self._event_loop, args=(server_sock,), daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        logger.info(
+            "FTPHoneypot listening on %s:%d (%d reactors)",
+            self._host, self._port, num_reactors,
+        )
 
     def stop(self):
         super().stop()
-        if self._server_socket:
+        for server_sock in self._server_sockets:
             try:
-                self._server_socket.close()
+                server_sock.close()
             except OSError:
                 pass
+        if self._log_thread:
+            self._log_queue.put(_LOG_STOP)
+            # Clear the handle so a repeated stop() cannot enqueue a second
+            # sentinel, which would kill the worker of the next start().
+            self._log_thread = None
+
+    # ------------------------------------------------------------------
+    # Reactor hooks
+    # ------------------------------------------------------------------
+
+    def _create_session(self, addr: tuple) -> _FTPSession:
+        return _FTPSession(addr)
+
+    def _on_data(self, session: _FTPSession, data: bytes) -> None:
+        self._handle_command(session, data)
+
+    def _on_session_end(self, session: _FTPSession) -> None:
+        # Analyzer + DB work happens on the log worker so it never blocks
+        # the loop; enqueueing is O(1) and the session state dies here.
+        raw_data = f"USER={session.username} PASS={session.password}"
+        self._log_queue.put(
+            (session.addr[0], session.addr[1], raw_data, "FTP_BRUTE_FORCE")
+        )
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _accept_loop(self):
-        while self._is_running:
-            try:
-                client_sock, addr = self._server_socket.accept()
-            except OSError:
+    @staticmethod
+    def _handle_command(session: _FTPSession, data: bytes):
+        # Compare the 4-byte command verb on the raw bytes; only the short
+        # argument is ever decoded, so a full-buffer UTF-8 pass (and the
+        # string allocations it implies) is skipped for every command.
+        session.commands += 1
+        verb = data[:4].upper()
+        if verb == b"USER":
+            session.username = data[4:].strip().decode("utf-8", errors="replace")
+            session.out_buf += _USER_OK
+        elif verb == b"PASS":
+            session.password = data[4:].strip().decode("utf-8", errors="replace")
+            session.out_buf += _PASS_FAIL
+            session.done = True
+        else:
+            session.out_buf += _GENERIC_ERR
+        if session.commands >= _MAX_COMMANDS:
+            session.done = True
+
+    def _log_worker(self):
+        """Drain finished sessions and run log_attack off the event loops."""
+        while True:
+            item = self._log_queue.get()
+            if item is _LOG_STOP:
                 break
-            t = threading.Thread(
-                target=self._handle_client,
-                args=(client_sock, addr),
-                daemon=True,
-            )
-            t.start()
-
-    def _handle_client(self, client_sock: socket.socket, addr: tuple):
-        attacker_ip, attacker_port = addr[0], addr[1]
-        username = ""
-        password = ""
-        try:
-            client_sock.settimeout(30)
-            client_sock.sendall(_BANNER)
-            # Collect up to two commands (USER + PASS)
-            for _ in range(4):
-                data = client_sock.recv(_RECV_SIZE)
-                if not data:
-                    break
-                line = data.decode("utf-8", errors="replace").strip()
-                upper = line.upper()
-                if upper.startswith("USER"):
-                    username = line[4:].strip()
-                    client_sock.sendall(_USER_OK)
-                elif upper.startswith("PASS"):
-                    password = line[4:].strip()
-                    client_sock.sendall(_PASS_FAIL)
-                    break
-                else:
-                    client_sock.sendall(_GENERIC_ERR)
-        except socket.timeout:
-            pass
-        except OSError:
-            pass
-        finally:
             try:
-                client_sock.close()
-            except OSError:
-                pass
-
-        raw_data = f"USER={username} PASS={password}"
-        self.log_attack(attacker_ip, attacker_port, raw_data, "FTP_BRUTE_FORCE")
+                self.log_attack(*item)
+            except Exception:
+                logger.exception("log_attack failed for FTP session %s", item[:2])
@@ -1,8 +1,9 @@
 import logging
+import re
 import socket
 import threading
 
-from .base import BaseHoneypot
+from .base import BaseHoneypot, ReactorSession
 
 logger = logging.getLogger(__name__)
 
@@ -19,11 +20,42 @@ _FAKE_RESPONSE = (
     "<html><body><h1>It works!</h1></body></html>"
 )
 
+# Encoded once at import time; the payload is pure ASCII, so re-encoding it
+# per connection was pure waste.
+_FAKE_RESPONSE_BYTES: bytes = _FAKE_RESPONSE.encode("ascii")
+
 _HTTP_METHODS = {"GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS", "PATCH", "TRACE", "CONNECT"}
+_HTTP_METHODS_BYTES = frozenset(m.encode("ascii") for m in _HTTP_METHODS)
+
+# Parsing caps: bigger payloads are summarized instead of parsed so a
+# deliberately huge probe cannot buy CPU with its own bytes.
+_MAX_REQUEST_SIZE = 16 * 1024
+_MAX_HEADERS = 64
+
+# Compiled once: the regex engine extracts each field in a single C-level
+# scan instead of the per-line split/partition loop running in bytecode.
+_REQUEST_LINE_RE = re.compile(rb"([^ \t\r\n]+)(?:[ \t]+([^ \t\r\n]+))?")
+_HEADER_RE = re.compile(rb"^([^:\r\n]+):[ \t]*([^\r\n]*)", re.MULTILINE)
+
+
+class _HTTPSession(ReactorSession):
+    """Per-connection state tracked by the selector loop."""
+
+    __slots__ = ("raw",)
+
+    def __init__(self, addr: tuple):
+        super().__init__(addr)
+        self.raw = b""
 
 
 class HTTPHoneypot(BaseHoneypot):
-    """TCP honeypot that mimics an HTTP server to detect web probes and scans."""
+    """TCP honeypot that mimics an HTTP server to detect web probes and scans.
+
+    Each probe is a one-shot exchange (recv, send canned response, close),
+    served by the selector reactor shared with the other honeypots.
+    """
+
+    _recv_size = _RECV_SIZE
 
     def __init__(self, host: str = "0.0.0.0", port: int = _DEFAULT_PORT):
         super().__init__(host, port, "HTTP")
@@ -38,10 +70,13 @@ class HTTPHoneypot(BaseHoneypot):
         self._server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self._server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self._server_socket.bind((self._host, self._port))
-        self._server_socket.listen(10)
+        self._server_socket.listen(128)
+        self._server_socket.setblocking(False)
         self._is_running = True
 
-        self._thread = threading.Thread(target=self._accept_loop, daemon=True)
+        self._thread = threading.Thread(
+            target=self._event_loop, args=(self._server_socket,), daemon=True
+        )
         self._thread.start()
         logger.info("HTTPHoneypot listening on %s:%d", self._host, self._port)
 
@@ -54,58 +89,47 @@ class HTTPHoneypot(BaseHoneypot):
                 pass
 
     # ------------------------------------------------------------------
-    # Internal helpers
+    # Reactor hooks
     # ------------------------------------------------------------------
 
-    def _accept_loop(self):
-        while self._is_running:
-            try:
-                client_sock, addr = self._server_socket.accept()
-            except OSError:
-                break
-            t = threading.Thread(
-                target=self._handle_client,
-                args=(client_sock, addr),
-                daemon=True,
-            )
-            t.start()
-
-    def _handle_client(self, client_sock: socket.socket, addr: tuple):
-        attacker_ip, attacker_port = addr[0], addr[1]
-        raw_request = ""
-        try:
-            client_sock.settimeout(30)
-            data = client_sock.recv(_RECV_SIZE)
-            raw_request = data.decode("utf-8", errors="replace")
-            client_sock.sendall(_FAKE_RESPONSE.encode())
-        except socket.timeout:
-            pass
-        except OSError:
-            pass
-        finally:
-            try:
-                client_sock.close()
-            except OSError:
-                pass
+    def _create_session(self, addr: tuple) -> _HTTPSession:
+        return _HTTPSession(addr)
+
+    def _on_data(self, session: _HTTPSession, data: bytes) -> None:
+        session.raw = data
+        session.out_buf = _FAKE_RESPONSE_BYTES
+        session.done = True
 
-        attack_data = self._parse_request(raw_request)
-        self.log_attack(attacker_ip, attacker_port, attack_data, "HTTP_PROBE")
+    def _on_session_end(self, session: _HTTPSession) -> None:
+        attack_data = self._parse_request(session.raw)
+        self.log_attack(session.addr[0], session.addr[1], attack_data, "HTTP_PROBE")
 
     @staticmethod
-    def _parse_request(raw: str) -> str:
-        """Extract method, path and headers from a raw HTTP request string."""
-        lines = raw.splitlines()
-        if not lines:
-            return raw
-        request_line = lines[0]
-        parts = request_line.split()
-        method = parts[0] if parts else "UNKNOWN"
-        if method not in _HTTP_METHODS:
-            method = "UNKNOWN"
-        path = parts[1] if len(parts) > 1 else "/"
-        headers = {
-            line.split(":", 1)[0].strip(): line.split(":", 1)[1].strip()
-            for line in lines[1:]
-            if ":" in line
-        }
+    def _parse_request(raw: bytes) -> str:
+        """Extract method, path and headers from a raw HTTP request.
+
+        Works directly on the received bytes: headers are ASCII in practice,
+        so only the short method/path/header fragments that survive parsing
+        are decoded, never the full recv buffer.
+        """
+        if len(raw) > _MAX_REQUEST_SIZE:
+            return f"method=UNKNOWN path=/ oversized={len(raw)}"
+        line = _REQUEST_LINE_RE.match(raw)
+        if line is None:
+            return raw.decode("utf-8", errors="replace")
+        method_b, path_b = line.group(1, 2)
+        method = method_b.decode("ascii") if method_b in _HTTP_METHODS_BYTES else "UNKNOWN"
+        path = path_b.decode("utf-8", errors="replace") if path_b else "/"
+        headers = {}
+        newline = raw.find(b"\n")
+        if newline != -1:
+            for count, match in enumerate(_HEADER_RE.finditer(raw, newline + 1)):
+                # Header count is capped so a payload stuffed with colon
+                # lines cannot buy unbounded work.
+                if count >= _MAX_HEADERS:
+                    break
+                key, value = match.group(1, 2)
+                headers[key.strip().decode("utf-8", errors="replace")] = value.strip().decode(
+                    "utf-8", errors="replace"
+                )
         return f"method={method} path={path} headers={headers}"
@@ -2,7 +2,7 @@ import logging
 import socket
 import threading
 
-from .base import BaseHoneypot
+from .base import BaseHoneypot, ReactorSession
 
 logger = logging.getLogger(__name__)
 
@@ -11,8 +11,26 @@ _DEFAULT_PORT = 2222
 _RECV_SIZE = 1024
 
 
+class _SSHSession(ReactorSession):
+    """Per-connection state tracked by the selector loop."""
+
+    __slots__ = ("raw",)
+
+    def __init__(self, addr: tuple):
+        # The banner is queued up front, so the session starts out
+        # write-interested.
+        super().__init__(addr, out_buf=_SSH_BANNER)
+        self.raw = b""
+
+
 class SSHHoneypot(BaseHoneypot):
-    """TCP honeypot that mimics an SSH server to capture brute-force attempts."""
+    """TCP honeypot that mimics an SSH server to capture brute-force attempts.
+
+    The exchange is one-shot (send banner, recv client identification,
+    close), served by the selector reactor shared with the other honeypots.
+    """
+
+    _recv_size = _RECV_SIZE
 
     def __init__(self, host: str = "0.0.0.0", port: int = _DEFAULT_PORT):
         super().__init__(host, port, "SSH")
@@ -24,14 +42,17 @@ class SSHHoneypot(BaseHoneypot):
     # ------------------------------------------------------------------
 
     def start(self):
-        """Bind the socket and begin accepting connections in a daemon thread."""
+        """Bind the socket and begin serving connections in a daemon thread."""
         self._server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self._server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self._server_socket.bind((self._host, self._port))
-        self._server_socket.listen(5)
+        self._server_socket.listen(128)
+        self._server_socket.setblocking(False)
         self._is_running = True
 
-        self._thread = threading.Thread(target=self._accept_loop, daemon=True)
+        self._thread = threading.Thread(
+            target=self._event_loop, args=(self._server_socket,), daemon=True
+        )
         self._thread.start()
         logger.info("SSHHoneypot listening on %s:%d", self._host, self._port)
 
@@ -44,38 +65,18 @@ class SSHHoneypot(BaseHoneypot):
                 pass
 
     # ------------------------------------------------------------------
-    # Internal helpers
+    # Reactor hooks
     # ------------------------------------------------------------------
 
-    def _accept_loop(self):
-        while self._is_running:
-            try:
-                client_sock, addr = self._server_socket.accept()
-            except OSError:
-                break
-            t = threading.Thread(
-                target=self._handle_client,
-                args=(client_sock, addr),
-                daemon=True,
-            )
-            t.start()
-
-    def _handle_client(self, client_sock: socket.socket, addr: tuple):
-        attacker_ip, attacker_port = addr[0], addr[1]
-        raw_data = ""
-        try:
-            client_sock.settimeout(30)
-            client_sock.sendall(_SSH_BANNER)
-            data = client_sock.recv(_RECV_SIZE)
-            raw_data = data.decode("utf-8", errors="replace").strip()
-        except socket.timeout:
-            pass
-        except OSError:
-            pass
-        finally:
-            try:
-                client_sock.close()
-            except OSError:
-                pass
+    def _create_session(self, addr: tuple) -> _SSHSession:
+        return _SSHSession(addr)
+
+    def _on_data(self, session: _SSHSession, data: bytes) -> None:
+        session.raw = data
+        session.done = True
 
-        self.log_attack(attacker_ip, attacker_port, raw_data, "SSH_BRUTE_FORCE")
+    def _on_session_end(self, session: _SSHSession) -> None:
+        # Decode once here, at log time; the bytes sit untouched in the
+        # session for the connection's whole lifetime.
+        raw_data = session.raw.decode("utf-8", errors="replace").strip()
+        self.log_attack(session.addr[0], session.addr[1], raw_data, "SSH_BRUTE_FORCE")
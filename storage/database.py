@@ -1,12 +1,107 @@
+import collections
+import itertools
 import logging
+import queue
 import sqlite3
 import threading
-from typing import Dict, List, Optional
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from fastrlock.rlock import FastRLock as _FastLock
+except ImportError:  # pragma: no cover - wheel not available on all platforms
+    _FastLock = threading.Lock
 
 logger = logging.getLogger(__name__)
 
 _ALLOWED_FILTER_COLS = frozenset({"honeypot_type", "attack_type", "attacker_ip", "threat_level"})
 
+# Upper bound on events written per transaction by the background writer.
+_WRITE_BATCH_SIZE = 256
+
+# Current schema revision, stamped into PRAGMA user_version once the DDL
+# has run. Bump when _DDL changes in a way existing databases must apply.
+_SCHEMA_VERSION = 1
+
+# Connections kept for read queries; under WAL they all run concurrently
+# with the single writer. LIFO reuse keeps the hottest connection's page
+# cache warm.
+_READ_POOL_SIZE = 4
+
+# Bound on queued-but-unwritten events. When a flood outpaces the writer,
+# deque(maxlen=...) silently drops the oldest entries — losing some events
+# under DoS is preferable to unbounded memory growth.
+_INGEST_QUEUE_MAX = 100_000
+
+# Sentinel telling the writer thread to exit.
+_STOP = object()
+
+# Batches between passive WAL checkpoints issued by the writer thread.
+# Passive checkpoints never block readers, and spreading them out avoids
+# the stall of one huge autocheckpoint during a flood.
+_CHECKPOINT_EVERY_BATCHES = 64
+
+_ATTACK_INSERT_SQL = """
+INSERT INTO attack_events
+    (timestamp, attacker_ip, attacker_port, honeypot_type,
+     attack_type, raw_data, threat_level, attack_pattern)
+VALUES
+    (:timestamp, :attacker_ip, :attacker_port, :honeypot_type,
+     :attack_type, :raw_data, :threat_level, :attack_pattern)
+"""
+
+_ALERT_INSERT_SQL = """
+INSERT INTO alerts (timestamp, attacker_ip, alert_type, detail, attack_id)
+VALUES (:timestamp, :attacker_ip, :alert_type, :detail, :attack_id)
+"""
+
+# Result column order for SELECT * on each table, fixed by _DDL. Building
+# dicts via zip against these skips both the per-row sqlite3.Row object and
+# the per-call cursor.description lookup.
+_ATTACK_COLS = (
+    "id", "timestamp", "attacker_ip", "attacker_port", "honeypot_type",
+    "attack_type", "raw_data", "threat_level", "attack_pattern",
+)
+_ALERT_COLS = ("id", "timestamp", "attacker_ip", "alert_type", "detail", "attack_id")
+
+_ATTACK_BY_ID_SQL = "SELECT * FROM attack_events WHERE id = ?"
+
+_ALERTS_SQL = "SELECT * FROM alerts ORDER BY id DESC LIMIT ? OFFSET ?"
+
+_EXPORT_STATE_SQL = "SELECT MAX(id), COUNT(*) FROM attack_events"
+
+# Timestamps are ISO-8601 (YYYY-MM-DDTHH:...), so the hour is a fixed
+# two-character substring. With the covering (timestamp, id) index the range
+# scan and the substr both run off the index without touching the table,
+# where strftime forced a row fetch per match.
+_BUSIEST_HOUR_SQL = (
+    "SELECT substr(timestamp, 12, 2) as hr, COUNT(*) as cnt "
+    "FROM attack_events "
+    "WHERE timestamp >= datetime('now', '-24 hours') "
+    "GROUP BY hr ORDER BY cnt DESC LIMIT 1"
+)
+
+def _attacks_select(combo: Tuple[str, ...], seek: bool) -> str:
+    clauses = [f"{col} = ?" for col in combo]
+    if seek:
+        clauses.append("id < ?")
+    where = " WHERE " + " AND ".join(clauses) if clauses else ""
+    return f"SELECT * FROM attack_events{where} ORDER BY id DESC LIMIT ? OFFSET ?"
+
+
+# Every legal filter-column combination (4 columns, 16 subsets) compiled to
+# its full SELECT once at import time, in offset and keyset (id < ?)
+# variants. Identical statement strings per call mean sqlite3's
+# per-connection prepared-statement cache always hits, and the per-call
+# f-string assembly disappears.
+_FILTER_COMBOS = [
+    combo
+    for n in range(len(_ALLOWED_FILTER_COLS) + 1)
+    for combo in itertools.combinations(sorted(_ALLOWED_FILTER_COLS), n)
+]
+_ATTACKS_SQL_BY_FILTER = {combo: _attacks_select(combo, seek=False) for combo in _FILTER_COMBOS}
+_ATTACKS_SEEK_SQL_BY_FILTER = {combo: _attacks_select(combo, seek=True) for combo in _FILTER_COMBOS}
+
 _DDL = """
 CREATE TABLE IF NOT EXISTS attack_events (
     id             INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -20,8 +115,15 @@ CREATE TABLE IF NOT EXISTS attack_events (
     attack_pattern TEXT
 );
 CREATE INDEX IF NOT EXISTS idx_timestamp    ON attack_events(timestamp);
+CREATE INDEX IF NOT EXISTS idx_timestamp_id ON attack_events(timestamp, id);
 CREATE INDEX IF NOT EXISTS idx_attacker_ip  ON attack_events(attacker_ip);
 CREATE INDEX IF NOT EXISTS idx_honeypot_type ON attack_events(honeypot_type);
+-- Composite (filter column, id DESC) indexes let a filtered get_attacks()
+-- run as one index range scan in id order: no sort, no temp B-tree.
+CREATE INDEX IF NOT EXISTS idx_type_id   ON attack_events(attack_type, id DESC);
+CREATE INDEX IF NOT EXISTS idx_threat_id ON attack_events(threat_level, id DESC);
+CREATE INDEX IF NOT EXISTS idx_ip_id     ON attack_events(attacker_ip, id DESC);
+CREATE INDEX IF NOT EXISTS idx_hp_id     ON attack_events(honeypot_type, id DESC);
 CREATE TABLE IF NOT EXISTS alerts (
     id          INTEGER PRIMARY KEY AUTOINCREMENT,
     timestamp   TEXT    NOT NULL,
@@ -30,9 +132,32 @@ CREATE TABLE IF NOT EXISTS alerts (
     detail      TEXT,
     attack_id   INTEGER
 );
+CREATE INDEX IF NOT EXISTS idx_alerts_id ON alerts(id DESC);
 """
 
 
+def _configure_connection(conn: sqlite3.Connection) -> None:
+    """Apply the shared WAL/performance PRAGMAs to a connection.
+
+    WAL lets readers proceed while the writer is committing;
+    synchronous=NORMAL drops the per-commit fsync to a WAL-file sync, which
+    is safe under WAL (a crash can lose the last transactions but cannot
+    corrupt the database). The remaining PRAGMAs keep temp structures and a
+    generous page cache in memory and mmap the database file so reads skip
+    the read() syscall + copy.
+    """
+    conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    conn.execute("PRAGMA mmap_size=268435456;")  # 256 MiB
+    conn.execute("PRAGMA cache_size=-64000;")    # 64 MiB
+    # Let the WAL grow to ~2000 pages between autocheckpoints (the writer
+    # also checkpoints passively between batches) and cap the file so a
+    # flood-bloated WAL is truncated afterwards rather than kept forever.
+    conn.execute("PRAGMA wal_autocheckpoint=2000;")
+    conn.execute("PRAGMA journal_size_limit=67108864;")  # 64 MiB
+
+
 class AttackDatabase:
     """Singleton SQLite-backed storage for attack events."""
 
@@ -45,13 +170,81 @@ class AttackDatabase:
 
     def __init__(self, db_path: str = "honeypot.db"):
         self._db_path = db_path
-        self._lock = threading.Lock()
-        self._conn = sqlite3.connect(db_path, check_same_thread=False)
-        self._conn.row_factory = sqlite3.Row
-        self._conn.execute("PRAGMA journal_mode=WAL;")
-        # executescript() is required to run multiple DDL statements at once;
-        # it commits automatically after each statement.
-        self._conn.executescript(_DDL)
+        self._lock = _FastLock()
+        # A separate :memory: connection would open a different empty
+        # database, so in-memory databases (used by the tests) keep every
+        # reader on the shared, lock-guarded writer connection.
+        self._is_memory = db_path == ":memory:"
+        # isolation_level=None puts the connection in autocommit mode: the
+        # write paths issue explicit BEGIN IMMEDIATE/COMMIT, avoiding the
+        # implicit transaction the sqlite3 module otherwise opens (and
+        # sometimes restarts) around every DML statement.
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        _configure_connection(self._conn)
+        # Only run (and re-parse) the DDL batch when the database has not
+        # been stamped with the current schema version; reopening an
+        # existing file skips straight past it. executescript() is required
+        # to run multiple DDL statements at once.
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < _SCHEMA_VERSION:
+            self._conn.executescript(_DDL)
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        # Refresh planner statistics so the composite indexes are chosen.
+        self._conn.execute("ANALYZE;")
+        # Highest attack id known to be committed. Lookups above it (or
+        # below 1) can answer None without issuing any SQL.
+        self._id_hi: int = self._conn.execute(
+            "SELECT COALESCE(MAX(id), 0) FROM attack_events"
+        ).fetchone()[0]
+        self._stats_lock = threading.Lock()
+        self._load_stats_state()
+        self._read_pool: queue.LifoQueue = queue.LifoQueue()
+        if not self._is_memory:
+            for _ in range(_READ_POOL_SIZE):
+                conn = sqlite3.connect(db_path, check_same_thread=False)
+                _configure_connection(conn)
+                self._read_pool.put(conn)
+        # deque.append is atomic and lock-free from the caller's view; the
+        # Event wakes the writer without a condition-variable handshake.
+        self._ingest_queue: collections.deque = collections.deque(maxlen=_INGEST_QUEUE_MAX)
+        self._ingest_event = threading.Event()
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+
+    def _load_stats_state(self):
+        """Rehydrate the in-memory statistics counters from the database.
+
+        Runs the full aggregates exactly once, at startup; afterwards every
+        write keeps the counters current and reads never aggregate again.
+        """
+        conn = self._conn
+        self._stats_total: int = conn.execute(
+            "SELECT COUNT(*) FROM attack_events"
+        ).fetchone()[0]
+        self._stats_by_type = collections.Counter(
+            dict(conn.execute(
+                "SELECT attack_type, COUNT(*) FROM attack_events GROUP BY attack_type"
+            ))
+        )
+        self._stats_by_threat = collections.Counter(
+            dict(conn.execute(
+                "SELECT threat_level, COUNT(*) FROM attack_events GROUP BY threat_level"
+            ))
+        )
+        self._stats_by_ip = collections.Counter(
+            dict(conn.execute(
+                "SELECT attacker_ip, COUNT(*) FROM attack_events GROUP BY attacker_ip"
+            ))
+        )
+
+    def _stats_note_rows(self, rows: List[dict]):
+        """Fold freshly committed rows into the statistics counters."""
+        with self._stats_lock:
+            self._stats_total += len(rows)
+            for row in rows:
+                self._stats_by_type[row["attack_type"]] += 1
+                self._stats_by_threat[row["threat_level"]] += 1
+                self._stats_by_ip[row["attacker_ip"]] += 1
 
     @classmethod
     def get_instance(cls, db_path: str = "honeypot.db") -> "AttackDatabase":
@@ -66,10 +259,24 @@ class AttackDatabase:
         """Reset singleton – intended for use in tests only."""
         with cls._class_lock:
             if cls._instance is not None:
+                try:
+                    cls._instance._enqueue(_STOP)
+                    cls._instance._writer_thread.join(timeout=1.0)
+                except Exception:
+                    pass
                 try:
                     cls._instance._conn.close()
                 except Exception:
                     pass
+                while True:
+                    try:
+                        conn = cls._instance._read_pool.get_nowait()
+                    except queue.Empty:
+                        break
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
             cls._instance = None
 
     # ------------------------------------------------------------------
@@ -77,16 +284,25 @@ class AttackDatabase:
     # ------------------------------------------------------------------
 
     def record_attack(self, event_dict: dict) -> int:
-        """Insert an attack event and return the new row id."""
-        sql = """
-        INSERT INTO attack_events
-            (timestamp, attacker_ip, attacker_port, honeypot_type,
-             attack_type, raw_data, threat_level, attack_pattern)
-        VALUES
-            (:timestamp, :attacker_ip, :attacker_port, :honeypot_type,
-             :attack_type, :raw_data, :threat_level, :attack_pattern)
-        """
-        row = {
+        """Insert an attack event synchronously and return the new row id."""
+        row = self._attack_row(event_dict)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                attack_id = self._conn.execute(_ATTACK_INSERT_SQL, row).lastrowid
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            if attack_id > self._id_hi:
+                self._id_hi = attack_id
+        self._stats_note_rows([row])
+        return attack_id
+
+    @staticmethod
+    def _attack_row(event_dict: dict) -> dict:
+        """Normalize an event dict into the insert parameter mapping."""
+        return {
             "timestamp": event_dict.get("timestamp", ""),
             "attacker_ip": event_dict.get("attacker_ip", ""),
             "attacker_port": int(event_dict.get("attacker_port", 0)),
@@ -96,92 +312,220 @@ class AttackDatabase:
             "threat_level": event_dict.get("threat_level", "LOW"),
             "attack_pattern": event_dict.get("attack_pattern", "UNKNOWN"),
         }
-        with self._lock:
-            cursor = self._conn.execute(sql, row)
-            self._conn.commit()
-            return cursor.lastrowid
+
+    def enqueue_attack(self, event_dict: dict, alert_dict: Optional[dict] = None) -> None:
+        """Queue an attack event (and optional alert) for the background writer.
+
+        Fire-and-forget: the caller returns immediately and the writer thread
+        commits queued events in batched transactions, so honeypot handlers
+        never block on a per-event fsync. The alert, if given, is linked to
+        the inserted attack row by the writer.
+        """
+        self._enqueue(("event", event_dict, alert_dict))
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until every event queued so far has been committed."""
+        done = threading.Event()
+        self._enqueue(("flush", done, None))
+        return done.wait(timeout)
+
+    def _enqueue(self, item) -> None:
+        self._ingest_queue.append(item)
+        self._ingest_event.set()
+
+    def _writer_loop(self):
+        q = self._ingest_queue
+        batches_since_checkpoint = 0
+        while True:
+            self._ingest_event.wait()
+            self._ingest_event.clear()
+            while True:
+                batch: List[Tuple] = []
+                while len(batch) < _WRITE_BATCH_SIZE:
+                    try:
+                        item = q.popleft()
+                    except IndexError:
+                        break
+                    if item is _STOP:
+                        if batch:
+                            self._write_batch(batch)
+                        return
+                    batch.append(item)
+                if not batch:
+                    break
+                self._write_batch(batch)
+                batches_since_checkpoint += 1
+                if batches_since_checkpoint >= _CHECKPOINT_EVERY_BATCHES:
+                    batches_since_checkpoint = 0
+                    try:
+                        with self._lock:
+                            self._conn.execute("PRAGMA wal_checkpoint(PASSIVE);")
+                    except sqlite3.Error:
+                        logger.exception("Passive WAL checkpoint failed")
+
+    def _write_batch(self, batch: List[Tuple]):
+        """Commit a batch of queued items in a single transaction.
+
+        Events without an alert — the overwhelming majority — go through a
+        single executemany() call, one statement-step loop in C instead of
+        one Python execute() per row. Events carrying an alert still insert
+        individually because the alert row needs the attack's lastrowid.
+        """
+        flush_markers = []
+        plain_rows = []
+        with_alerts = []
+        for kind, payload, alert in batch:
+            if kind == "flush":
+                flush_markers.append(payload)
+            elif alert is None:
+                plain_rows.append(self._attack_row(payload))
+            else:
+                with_alerts.append((self._attack_row(payload), alert))
+        try:
+            with self._lock:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    if plain_rows:
+                        self._conn.executemany(_ATTACK_INSERT_SQL, plain_rows)
+                    for row, alert in with_alerts:
+                        alert["attack_id"] = self._conn.execute(
+                            _ATTACK_INSERT_SQL, row
+                        ).lastrowid
+                        self._insert_alert(alert)
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+                if plain_rows or with_alerts:
+                    self._id_hi = self._conn.execute(
+                        "SELECT COALESCE(MAX(id), 0) FROM attack_events"
+                    ).fetchone()[0]
+            if plain_rows or with_alerts:
+                self._stats_note_rows(plain_rows + [row for row, _ in with_alerts])
+        except Exception:
+            logger.exception("Background writer failed for a batch of %d items", len(batch))
+        finally:
+            for marker in flush_markers:
+                marker.set()
 
     # ------------------------------------------------------------------
     # Read operations
     # ------------------------------------------------------------------
 
+    @contextmanager
+    def _acquire(self):
+        """Yield a connection for a read query.
+
+        Under WAL, readers run concurrently with the single writer without
+        any Python-side mutex, so reads borrow a connection from the small
+        LIFO pool — up to pool-size queries run in parallel. Only in-memory
+        databases fall back to the shared connection behind ``self._lock``.
+        """
+        if self._is_memory:
+            with self._lock:
+                yield self._conn
+            return
+        conn = self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+
     def get_attacks(
         self,
         limit: int = 100,
         offset: int = 0,
         filters: Optional[Dict] = None,
+        before_id: Optional[int] = None,
     ) -> List[dict]:
-        """Retrieve attack events with optional column=value filters."""
-        where_clauses = []
-        params: list = []
+        """Retrieve attack events with optional column=value filters.
+
+        ``before_id`` enables keyset pagination: rows strictly older than
+        the given id are returned, so page N costs the same index seek as
+        page 1. ``offset`` is retained for backward compatibility but walks
+        and discards ``offset`` rows per call.
+        """
+        cols: Tuple[str, ...] = ()
         if filters:
-            for col, val in filters.items():
+            for col in filters:
                 if col not in _ALLOWED_FILTER_COLS:
                     raise ValueError(f"Filter column '{col}' is not allowed")
-                where_clauses.append(f"{col} = ?")
-                params.append(val)
+            cols = tuple(sorted(filters))
+        params = tuple(filters[col] for col in cols) if cols else ()
+        if before_id is not None:
+            sql = _ATTACKS_SEEK_SQL_BY_FILTER[cols]
+            params += (before_id,)
+        else:
+            sql = _ATTACKS_SQL_BY_FILTER[cols]
+        params += (limit, offset)
 
-        where_sql = ("WHERE " + " AND ".join(where_clauses)) if where_clauses else ""
-        sql = f"SELECT * FROM attack_events {where_sql} ORDER BY id DESC LIMIT ? OFFSET ?"
-        params += [limit, offset]
-
-        with self._lock:
-            cursor = self._conn.execute(sql, params)
-            return [dict(row) for row in cursor.fetchall()]
+        with self._acquire() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [dict(zip(_ATTACK_COLS, row)) for row in rows]
 
     def get_attack_by_id(self, attack_id: int) -> Optional[dict]:
         """Return a single attack event by primary key, or None."""
-        sql = "SELECT * FROM attack_events WHERE id = ?"
-        with self._lock:
-            cursor = self._conn.execute(sql, (attack_id,))
-            row = cursor.fetchone()
-            return dict(row) if row else None
+        # Ids are monotonic, so anything outside [1, _id_hi] cannot exist
+        # and skips the index probe entirely.
+        if attack_id < 1 or attack_id > self._id_hi:
+            return None
+        with self._acquire() as conn:
+            row = conn.execute(_ATTACK_BY_ID_SQL, (attack_id,)).fetchone()
+        return dict(zip(_ATTACK_COLS, row)) if row else None
+
+    def get_export_state(self) -> Tuple[int, int]:
+        """Return ``(max id, row count)`` for attack_events.
+
+        A cheap change marker: the pair only moves when rows are added,
+        so callers can use it to validate caches of exported data.
+        """
+        with self._acquire() as conn:
+            row = conn.execute(_EXPORT_STATE_SQL).fetchone()
+        return (row[0] or 0, row[1])
+
+    def get_busiest_hour(self) -> Optional[str]:
+        """Return the busiest hour (``"00"``-``"23"``) of the last 24 hours, or None."""
+        with self._acquire() as conn:
+            rows = conn.execute(_BUSIEST_HOUR_SQL).fetchall()
+        return rows[0][0] if rows else None
 
     def get_attack_statistics(self) -> dict:
-        """Return aggregated statistics across all stored events."""
-        with self._lock:
-            total = self._conn.execute("SELECT COUNT(*) FROM attack_events").fetchone()[0]
-            unique_ips = self._conn.execute(
-                "SELECT COUNT(DISTINCT attacker_ip) FROM attack_events"
-            ).fetchone()[0]
-            by_type = {
-                row[0]: row[1]
-                for row in self._conn.execute(
-                    "SELECT attack_type, COUNT(*) FROM attack_events GROUP BY attack_type"
-                ).fetchall()
-            }
-            by_threat = {
-                row[0]: row[1]
-                for row in self._conn.execute(
-                    "SELECT threat_level, COUNT(*) FROM attack_events GROUP BY threat_level"
-                ).fetchall()
-            }
-            top_ips = [
-                {"ip": row[0], "count": row[1]}
-                for row in self._conn.execute(
-                    "SELECT attacker_ip, COUNT(*) as cnt FROM attack_events "
-                    "GROUP BY attacker_ip ORDER BY cnt DESC LIMIT 10"
-                ).fetchall()
-            ]
+        """Return aggregated statistics across all stored events.
 
-        return {
-            "total_attacks": total,
-            "unique_attackers": unique_ips,
-            "attacks_by_type": by_type,
-            "attacks_by_threat_level": by_threat,
-            "top_attacking_ips": top_ips,
-        }
+        Served entirely from the incrementally maintained in-memory
+        counters — no SQL is issued, so dashboard polling costs
+        microseconds regardless of table size.
+        """
+        with self._stats_lock:
+            return {
+                "total_attacks": self._stats_total,
+                "unique_attackers": len(self._stats_by_ip),
+                "attacks_by_type": dict(self._stats_by_type),
+                "attacks_by_threat_level": dict(self._stats_by_threat),
+                "top_attacking_ips": [
+                    {"ip": ip, "count": count}
+                    for ip, count in self._stats_by_ip.most_common(10)
+                ],
+            }
 
     # ------------------------------------------------------------------
     # Alert operations
     # ------------------------------------------------------------------
 
     def record_alert(self, alert_dict: dict) -> int:
-        """Insert an alert and return the new row id."""
-        sql = """
-        INSERT INTO alerts (timestamp, attacker_ip, alert_type, detail, attack_id)
-        VALUES (:timestamp, :attacker_ip, :alert_type, :detail, :attack_id)
-        """
+        """Insert an alert synchronously and return the new row id."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                alert_id = self._insert_alert(alert_dict)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            return alert_id
+
+    def _insert_alert(self, alert_dict: dict) -> int:
+        """Insert an alert row; caller holds the lock and commits."""
         row = {
             "timestamp": alert_dict.get("timestamp", ""),
             "attacker_ip": alert_dict.get("attacker_ip", ""),
@@ -189,14 +533,10 @@ class AttackDatabase:
             "detail": alert_dict.get("detail", ""),
             "attack_id": alert_dict.get("attack_id"),
         }
-        with self._lock:
-            cursor = self._conn.execute(sql, row)
-            self._conn.commit()
-            return cursor.lastrowid
+        return self._conn.execute(_ALERT_INSERT_SQL, row).lastrowid
 
     def get_alerts(self, limit: int = 100, offset: int = 0) -> List[dict]:
         """Retrieve alerts ordered by most recent first."""
-        sql = "SELECT * FROM alerts ORDER BY id DESC LIMIT ? OFFSET ?"
-        with self._lock:
-            cursor = self._conn.execute(sql, (limit, offset))
-            return [dict(row) for row in cursor.fetchall()]
+        with self._acquire() as conn:
+            rows = conn.execute(_ALERTS_SQL, (limit, offset)).fetchall()
+        return [dict(zip(_ALERT_COLS, row)) for row in rows]
@@ -0,0 +1,10 @@
+import os
+import sys
+
+# Under pytest the pythonpath ini option in pyproject.toml already puts the
+# repo root on sys.path; this insert covers invocations that bypass it, such
+# as running a test file directly (python tests/test_x.py) or invoking pytest
+# from outside the repo root without the ini file in scope.
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
@@ -1,9 +1,5 @@
-import sys
-import os
 import unittest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from analyzer.analyzer import AttackAnalyzer
 
 
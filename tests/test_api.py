@@ -1,9 +1,5 @@
-import sys
-import os
 import unittest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 # Reset singletons and configure in-memory DB before importing the Flask app
 from storage.database import AttackDatabase
 from analyzer.analyzer import AttackAnalyzer
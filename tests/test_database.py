@@ -1,10 +1,6 @@
-import sys
-import os
 import unittest
 from datetime import datetime, timezone
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from storage.database import AttackDatabase
 
 
@@ -89,6 +85,17 @@ class TestGetAttacks(unittest.TestCase):
         result_offset = self.db.get_attacks(limit=10, offset=2)
         self.assertEqual(len(result_offset), 3)
 
+    def test_before_id_returns_older_rows(self):
+        first_page = self.db.get_attacks(limit=2)
+        second_page = self.db.get_attacks(limit=2, before_id=first_page[-1]["id"])
+        self.assertEqual(len(second_page), 2)
+        self.assertLess(second_page[0]["id"], first_page[-1]["id"])
+
+    def test_before_id_matches_offset_pagination(self):
+        by_offset = self.db.get_attacks(limit=10, offset=2)
+        by_seek = self.db.get_attacks(limit=10, before_id=self.db.get_attacks(limit=2)[-1]["id"])
+        self.assertEqual([r["id"] for r in by_seek], [r["id"] for r in by_offset])
+
     def test_filter_by_attack_type(self):
         self.db.record_attack(_sample_event(attack_type="HTTP_PROBE", honeypot_type="HTTP"))
         result = self.db.get_attacks(filters={"attack_type": "HTTP_PROBE"})
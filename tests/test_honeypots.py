@@ -1,109 +1,170 @@
-import sys
-import os
-import unittest
-from unittest.mock import MagicMock, patch
-
-# Ensure repo root is on the path so imports resolve
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from honeypot.ssh_honeypot import SSHHoneypot
-from honeypot.http_honeypot import HTTPHoneypot
-from honeypot.ftp_honeypot import FTPHoneypot
-
-
-class TestSSHHoneypotInit(unittest.TestCase):
-    def test_defaults(self):
-        hp = SSHHoneypot()
-        self.assertEqual(hp.host, "0.0.0.0")
-        self.assertEqual(hp.port, 2222)
-        self.assertEqual(hp.honeypot_type, "SSH")
-
-    def test_custom_params(self):
-        hp = SSHHoneypot(host="127.0.0.1", port=9999)
-        self.assertEqual(hp.host, "127.0.0.1")
-        self.assertEqual(hp.port, 9999)
-
-    def test_not_running_initially(self):
-        hp = SSHHoneypot()
-        self.assertFalse(hp.is_running)
-
-
-class TestHTTPHoneypotInit(unittest.TestCase):
-    def test_defaults(self):
-        hp = HTTPHoneypot()
-        self.assertEqual(hp.host, "0.0.0.0")
-        self.assertEqual(hp.port, 8080)
-        self.assertEqual(hp.honeypot_type, "HTTP")
-
-    def test_not_running_initially(self):
-        hp = HTTPHoneypot()
-        self.assertFalse(hp.is_running)
-
-
-class TestFTPHoneypotInit(unittest.TestCase):
-    def test_defaults(self):
-        hp = FTPHoneypot()
-        self.assertEqual(hp.host, "0.0.0.0")
-        self.assertEqual(hp.port, 2121)
-        self.assertEqual(hp.honeypot_type, "FTP")
-
-    def test_not_running_initially(self):
-        hp = FTPHoneypot()
-        self.assertFalse(hp.is_running)
-
-
-class TestLogAttack(unittest.TestCase):
-    """Test that log_attack calls the database and analyzer singletons."""
-
-    def _make_mock_db(self):
-        mock_db = MagicMock()
-        mock_db.record_attack.return_value = 1
-        return mock_db
-
-    def _make_mock_analyzer(self):
-        mock_analyzer = MagicMock()
-        mock_analyzer.analyze_attack.return_value = {
-            "threat_level": "MEDIUM",
-            "attack_pattern": "BRUTE_FORCE",
-            "recommendations": [],
-        }
-        return mock_analyzer
-
-    def test_log_attack_calls_db_and_analyzer(self):
-        hp = SSHHoneypot()
-        mock_db = self._make_mock_db()
-        mock_analyzer = self._make_mock_analyzer()
-
-        with patch("storage.database.AttackDatabase.get_instance", return_value=mock_db), \
-             patch("analyzer.analyzer.AttackAnalyzer.get_instance", return_value=mock_analyzer):
-            result = hp.log_attack("1.2.3.4", 54321, "some data", "SSH_BRUTE_FORCE")
-
-        mock_analyzer.analyze_attack.assert_called_once()
-        mock_db.record_attack.assert_called_once()
-        self.assertEqual(result["threat_level"], "MEDIUM")
-        self.assertEqual(result["attack_pattern"], "BRUTE_FORCE")
-
-    def test_log_attack_returns_event_dict(self):
-        hp = HTTPHoneypot()
-        mock_db = self._make_mock_db()
-        mock_analyzer = self._make_mock_analyzer()
-
-        with patch("storage.database.AttackDatabase.get_instance", return_value=mock_db), \
-             patch("analyzer.analyzer.AttackAnalyzer.get_instance", return_value=mock_analyzer):
-            result = hp.log_attack("10.0.0.1", 80, "GET /", "HTTP_PROBE")
-
-        self.assertIn("timestamp", result)
-        self.assertIn("attacker_ip", result)
-        self.assertEqual(result["attacker_ip"], "10.0.0.1")
-
-
-class TestIsRunning(unittest.TestCase):
-    def test_stop_sets_is_running_false(self):
-        hp = SSHHoneypot()
-        hp._is_running = True
-        hp.stop()
-        self.assertFalse(hp.is_running)
-
+import copy
+from unittest.mock import Mock
 
-if __name__ == "__main__":
-    unittest.main()
+import pytest
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+# Module scope: tests that only read attributes (or call the stateless
+# log_attack) share one prebuilt instance per honeypot type instead of
+# re-constructing it per test. The honeypot package is imported inside
+# the fixtures (cached in sys.modules after the first hit) so collection
+# never pays for it.
+
+
+@pytest.fixture(scope="module")
+def ssh_hp():
+    from honeypot.ssh_honeypot import SSHHoneypot
+
+    return SSHHoneypot()
+
+
+@pytest.fixture(scope="module")
+def http_hp():
+    from honeypot.http_honeypot import HTTPHoneypot
+
+    return HTTPHoneypot()
+
+
+@pytest.fixture(scope="module")
+def ftp_hp():
+    from honeypot.ftp_honeypot import FTPHoneypot
+
+    return FTPHoneypot()
+
+
+# ---------------------------------------------------------------------------
+# Construction defaults
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "fixture_name,port,name",
+    [
+        ("ssh_hp", 2222, "SSH"),
+        ("http_hp", 8080, "HTTP"),
+        ("ftp_hp", 2121, "FTP"),
+    ],
+)
+def test_honeypot_defaults(request, fixture_name, port, name):
+    hp = request.getfixturevalue(fixture_name)
+    assert hp.host == "0.0.0.0"
+    assert hp.port == port
+    assert hp.honeypot_type == name
+    assert not hp.is_running
+
+
+def test_ssh_custom_params():
+    from honeypot.ssh_honeypot import SSHHoneypot
+
+    hp = SSHHoneypot(host="127.0.0.1", port=9999)
+    assert hp.host == "127.0.0.1"
+    assert hp.port == 9999
+
+
+# ---------------------------------------------------------------------------
+# log_attack
+# ---------------------------------------------------------------------------
+
+
+_FIXED_TIMESTAMP = "2024-01-01T00:00:00.000000+00:00"
+
+
+@pytest.fixture
+def frozen_time(monkeypatch):
+    """Pin honeypot.base._utc_timestamp so event timestamps are deterministic."""
+    import honeypot.base
+
+    monkeypatch.setattr(honeypot.base, "_utc_timestamp", lambda: _FIXED_TIMESTAMP)
+    return _FIXED_TIMESTAMP
+
+
+# Shared by every analyzer mock; tests only read from it, and the tuple
+# keeps recommendations immutable.
+_ANALYZER_RESULT = {
+    "threat_level": "MEDIUM",
+    "attack_pattern": "BRUTE_FORCE",
+    "recommendations": (),
+}
+
+
+# The templates are built (and their return values configured) once per
+# session; per-test fixtures hand out cheap copies. Copies share the
+# template's child mocks, so each hand-out resets call records to keep
+# tests isolated (return_value config survives reset_mock()). The spec
+# lists name exactly the methods log_attack uses, so any other attribute
+# access fails fast instead of silently minting a child mock.
+
+
+@pytest.fixture(scope="session")
+def _db_template():
+    mock_db = Mock(spec=["enqueue_attack"])
+    mock_db.enqueue_attack = Mock(return_value=None)
+    return mock_db
+
+
+@pytest.fixture(scope="session")
+def _analyzer_template():
+    mock_analyzer = Mock(spec=["analyze_attack"])
+    mock_analyzer.analyze_attack = Mock(return_value=_ANALYZER_RESULT)
+    return mock_analyzer
+
+
+@pytest.fixture
+def mock_db(_db_template):
+    mock_db = copy.copy(_db_template)
+    mock_db.reset_mock()
+    return mock_db
+
+
+@pytest.fixture
+def mock_analyzer(_analyzer_template):
+    mock_analyzer = copy.copy(_analyzer_template)
+    mock_analyzer.reset_mock()
+    return mock_analyzer
+
+
+@pytest.fixture
+def mocked_singletons(monkeypatch, mock_db, mock_analyzer):
+    """Swap the cached db/analyzer accessors in honeypot.base for mocks."""
+    import honeypot.base
+
+    monkeypatch.setattr(honeypot.base, "_database", lambda: mock_db)
+    monkeypatch.setattr(honeypot.base, "_analyzer", lambda: mock_analyzer)
+    return mock_db, mock_analyzer
+
+
+@pytest.mark.parametrize(
+    "fixture_name,ip,port,data,kind",
+    [
+        ("ssh_hp", "1.2.3.4", 54321, "some data", "SSH_BRUTE_FORCE"),
+        ("http_hp", "10.0.0.1", 80, "GET /", "HTTP_PROBE"),
+    ],
+)
+def test_log_attack(request, fixture_name, ip, port, data, kind, mocked_singletons, frozen_time):
+    hp = request.getfixturevalue(fixture_name)
+    mock_db, mock_analyzer = mocked_singletons
+
+    result = hp.log_attack(ip, port, data, kind)
+
+    mock_analyzer.analyze_attack.assert_called_once()
+    mock_db.enqueue_attack.assert_called_once()
+    assert result["threat_level"] == "MEDIUM"
+    assert result["attack_pattern"] == "BRUTE_FORCE"
+    assert result["timestamp"] == frozen_time
+    assert result["attacker_ip"] == ip
+
+
+# ---------------------------------------------------------------------------
+# Lifecycle
+# ---------------------------------------------------------------------------
+
+
+# Safe with the shared module-scoped instance: stop() leaves _is_running
+# False, the state every other test expects.
+def test_stop_clears_is_running(ssh_hp):
+    ssh_hp._is_running = True
+    ssh_hp.stop()
+    assert not ssh_hp.is_running